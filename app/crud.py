@@ -1,7 +1,10 @@
-from sqlalchemy import and_, update, delete
-from sqlalchemy.orm import Session, Query
+from sqlalchemy import and_, update, delete, select, bindparam
+from sqlalchemy.orm import Session
 from app.database import Base
 
+# Prebuilt primary key lookups, one per model, reused across calls
+_select_by_id_statements = {}
+
 
 def insert_record(db, model, **kwargs):
     """
@@ -75,7 +78,7 @@ def select_records(
     limit=None,
 ):
     """
-    Constructs a SQL query for selecting data from one or more tables, based on the given parameters.
+    Selects data from one or more tables, based on the given parameters.
 
     Parameters:
     db (SQLAlchemy Session): The database db to use.
@@ -87,20 +90,74 @@ def select_records(
     offset (int): The starting point for the operation.
     limit (int): The maximum number of items to process or retrieve.
     Returns:
-    SQLAlchemy Query: The constructed query object.
+    SQLAlchemy ScalarResult of model instances, or a Result of rows when select_cols is given.
     """
-    # create the initial query with the primary table
-    query = Query(session=db, entities=primary_table)
-
-    # add the select columns to the query
+    stmt = build_select(
+        primary_table,
+        select_cols,
+        join_conditions,
+        filter_conditions,
+        order_by,
+        group_by,
+        having,
+        offset,
+        limit,
+    )
+    result = db.execute(stmt)
     if select_cols:
-        query = query.with_entities(*select_cols)
+        return result
+    return result.scalars()
+
 
-    # build the query by applying joins, filters, ordering, grouping, and pagination
-    query = build_query(
-        query, join_conditions, filter_conditions, order_by, group_by, having, offset
+def select_record_by_id(db: Session, model: Base, record_id):
+    """
+    Select a single record by its primary key.
+
+    The statement is built once per model with a bound parameter for the id,
+    so repeated lookups skip query construction entirely.
+    Args:
+        db (Session): The SQLAlchemy database db.
+        model (Base): The SQLAlchemy model to select from.
+        record_id: The primary key of the record.
+    Returns:
+        Base: The matching record, or None.
+    """
+    stmt = _select_by_id_statements.get(model)
+    if stmt is None:
+        stmt = select(model).where(model.id == bindparam("record_id"))
+        _select_by_id_statements[model] = stmt
+    return db.execute(stmt, {"record_id": record_id}).scalars().first()
+
+
+def build_select(
+    primary_table,
+    select_cols=None,
+    join_conditions=None,
+    filter_conditions=None,
+    order_by=None,
+    group_by=None,
+    having=None,
+    offset=None,
+    limit=None,
+):
+    """Build a select() statement for the primary table, or for select_cols from it."""
+    # create the initial statement with the primary table
+    if select_cols:
+        stmt = select(*select_cols).select_from(primary_table)
+    else:
+        stmt = select(primary_table)
+
+    # build the statement by applying joins, filters, ordering, grouping, and pagination
+    return build_query(
+        stmt,
+        join_conditions,
+        filter_conditions,
+        order_by,
+        group_by,
+        having,
+        offset,
+        limit,
     )
-    return query
 
 
 def apply_joins(query, join_conditions):
@@ -151,6 +208,7 @@ def build_query(
     group_by=None,
     having=None,
     offset=None,
+    limit=None,
 ):
     """Build the query by applying joins, filters, ordering, grouping, and pagination."""
     if join_conditions:
@@ -158,5 +216,5 @@ def build_query(
     query = apply_filters(query, filter_conditions)
     query = apply_order_by(query, order_by)
     query = apply_group_by(query, group_by, having)
-    query = apply_pagination(query, offset)
+    query = apply_pagination(query, offset, limit)
     return query
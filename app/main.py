@@ -1,11 +1,34 @@
+import os
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from app import models, database
-from app.routes import user_route, fitness_class_route, booking_route
+from sqlalchemy import text
+from app import database
+from app.routes import user_route, fitness_class_route, booking_route, analytics_route
 
-models.Base.metadata.create_all(bind=database.engine)
 
-app = FastAPI(title="FitStudio Booking API")
+def _env_flag(name: str) -> bool:
+    return os.getenv(name, "").lower() in ("1", "true", "yes")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Schema creation lives behind `python -m app.manage init-db`; this flag
+    # keeps the old create-on-boot behaviour available for local development.
+    if _env_flag("FITSTUDIO_CREATE_SCHEMA"):
+        database.Base.metadata.create_all(bind=database.engine)
+
+    # Open a pooled connection up front so the first request doesn't pay for it
+    if _env_flag("FITSTUDIO_WARM_POOL"):
+        with database.engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+
+    yield
+    database.engine.dispose()
+
+
+app = FastAPI(title="FitStudio Booking API", lifespan=lifespan)
 
 app.include_router(user_route.router, prefix="/api/users")
 app.include_router(fitness_class_route.router, prefix="/api/fitness_classes")
 app.include_router(booking_route.router, prefix="/api/bookings")
+app.include_router(analytics_route.router, prefix="/api/analytics")
@@ -0,0 +1,44 @@
+"""
+Management commands for the FitStudio backend.
+
+Usage:
+    python -m app.manage init-db
+    python -m app.manage rebuild-rollups
+"""
+
+import argparse
+from app import models, database
+from app.services import analytics_service
+
+
+def init_db():
+    """Create any missing tables in the configured database."""
+    models.Base.metadata.create_all(bind=database.engine)
+    print(f"Database schema is up to date ({database.DATABASE_URL})")
+
+
+def rebuild_rollups():
+    """Recompute the booking analytics rollups from the bookings table."""
+    db = database.SessionLocal()
+    try:
+        analytics_service.rebuild_rollups(db)
+    finally:
+        db.close()
+    print("Booking rollups rebuilt")
+
+
+COMMANDS = {
+    "init-db": init_db,
+    "rebuild-rollups": rebuild_rollups,
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m app.manage")
+    parser.add_argument("command", choices=sorted(COMMANDS))
+    args = parser.parse_args(argv)
+    COMMANDS[args.command]()
+
+
+if __name__ == "__main__":
+    main()
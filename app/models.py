@@ -10,24 +10,60 @@ from sqlalchemy import (
 )
 from sqlalchemy.dialects.sqlite import BLOB
 from sqlalchemy.orm import relationship
+from sqlalchemy.types import TypeDecorator
 from app.database import Base
+import os
+import time
 import uuid
 
 
+def uuid7() -> str:
+    """Return a new time-ordered UUIDv7 (RFC 9562) as a string."""
+    unix_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = (unix_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= 0x7 << 76  # version
+    value |= (rand >> 68) << 64  # rand_a, 12 bits
+    value |= 0b10 << 62  # variant
+    value |= rand & 0x3FFF_FFFF_FFFF_FFFF  # rand_b, 62 bits
+    return str(uuid.UUID(int=value))
+
+
+class UUIDBlob(TypeDecorator):
+    """Stores UUIDs as 16-byte BLOBs while exposing them as canonical strings."""
+
+    impl = BLOB
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if isinstance(value, uuid.UUID):
+            return value.bytes
+        # Raises ValueError for malformed IDs; routes validate IDs as uuid.UUID first
+        return uuid.UUID(value).bytes
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return str(uuid.UUID(bytes=value))
+
+
 class User(Base):
     __tablename__ = "users"
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(UUIDBlob, primary_key=True, default=uuid7)
     name = Column(String, nullable=False)
     email = Column(String, unique=True, nullable=False)
 
 
 class FitnessClass(Base):
     __tablename__ = "fitness_classes"
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(UUIDBlob, primary_key=True, default=uuid7)
     name = Column(String, nullable=False)
     instructor = Column(String, nullable=False)
     class_date = Column(Date, nullable=False)
     start_time = Column(Time, nullable=False)
+    duration_minutes = Column(Integer, nullable=False, default=60, server_default="60")
     available_slots = Column(Integer, nullable=False)
     description = Column(String)
 
@@ -40,9 +76,9 @@ class FitnessClass(Base):
 
 class Booking(Base):
     __tablename__ = "bookings"
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    user_id = Column(String, ForeignKey("users.id"), nullable=False)
-    class_id = Column(String, ForeignKey("fitness_classes.id"), nullable=False)
+    id = Column(UUIDBlob, primary_key=True, default=uuid7)
+    user_id = Column(UUIDBlob, ForeignKey("users.id"), nullable=False)
+    class_id = Column(UUIDBlob, ForeignKey("fitness_classes.id"), nullable=False)
     booked_at = Column(Date, nullable=False)
 
     user = relationship("User")
@@ -51,3 +87,24 @@ class Booking(Base):
     __table_args__ = (
         UniqueConstraint("user_id", "class_id", name="uix_user_class_booking"),
     )
+
+
+class DailyClassBookingRollup(Base):
+    __tablename__ = "daily_class_booking_rollups"
+    booking_date = Column(Date, primary_key=True)
+    class_id = Column(UUIDBlob, primary_key=True)
+    bookings = Column(Integer, nullable=False, default=0)
+
+
+class DailyInstructorBookingRollup(Base):
+    __tablename__ = "daily_instructor_booking_rollups"
+    booking_date = Column(Date, primary_key=True)
+    instructor = Column(String, primary_key=True)
+    bookings = Column(Integer, nullable=False, default=0)
+
+
+class DailyUserBookingRollup(Base):
+    __tablename__ = "daily_user_booking_rollups"
+    user_id = Column(UUIDBlob, primary_key=True)
+    booking_date = Column(Date, primary_key=True)
+    bookings = Column(Integer, nullable=False, default=0)
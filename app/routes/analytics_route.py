@@ -0,0 +1,76 @@
+from datetime import date
+from typing import List, Optional
+import uuid
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.orm import Session
+from app import schemas, database
+from app.services import analytics_service
+
+router = APIRouter(tags=["Analytics"])
+
+
+@router.get(
+    "/classes",
+    response_model=List[schemas.ClassBookingStats],
+    status_code=status.HTTP_200_OK,
+)
+def get_bookings_per_class(
+    date_from: Optional[date] = Query(None, description="Earliest booking date"),
+    date_to: Optional[date] = Query(None, description="Latest booking date"),
+    page: int = 1,
+    limit: int = 10,
+    db: Session = Depends(database.get_db),
+):
+    return analytics_service.get_bookings_per_class(
+        db, page=page, limit=limit, date_from=date_from, date_to=date_to
+    )
+
+
+@router.get(
+    "/instructors",
+    response_model=List[schemas.InstructorBookingStats],
+    status_code=status.HTTP_200_OK,
+)
+def get_bookings_per_instructor(
+    date_from: Optional[date] = Query(None, description="Earliest booking date"),
+    date_to: Optional[date] = Query(None, description="Latest booking date"),
+    page: int = 1,
+    limit: int = 10,
+    db: Session = Depends(database.get_db),
+):
+    return analytics_service.get_bookings_per_instructor(
+        db, page=page, limit=limit, date_from=date_from, date_to=date_to
+    )
+
+
+@router.get(
+    "/days",
+    response_model=List[schemas.DailyBookingStats],
+    status_code=status.HTTP_200_OK,
+)
+def get_bookings_per_day(
+    date_from: Optional[date] = Query(None, description="Earliest booking date"),
+    date_to: Optional[date] = Query(None, description="Latest booking date"),
+    page: int = 1,
+    limit: int = 31,
+    db: Session = Depends(database.get_db),
+):
+    return analytics_service.get_bookings_per_day(
+        db, page=page, limit=limit, date_from=date_from, date_to=date_to
+    )
+
+
+@router.get(
+    "/users/{user_id}",
+    response_model=schemas.UserBookingHistory,
+    status_code=status.HTTP_200_OK,
+)
+def get_user_booking_history(
+    user_id: uuid.UUID,
+    date_from: Optional[date] = Query(None, description="Earliest booking date"),
+    date_to: Optional[date] = Query(None, description="Latest booking date"),
+    db: Session = Depends(database.get_db),
+):
+    return analytics_service.get_user_booking_history(
+        db, str(user_id), date_from=date_from, date_to=date_to
+    )
@@ -1,4 +1,6 @@
-from typing import List
+from datetime import date
+from typing import List, Optional
+import uuid
 from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.orm import Session
 from app import schemas, database
@@ -19,13 +21,27 @@ def create_fitness_class(
     return fitness_class_service.create_fitness_class(db, fitness_class_data)
 
 
+@router.post(
+    "/bulk",
+    response_model=schemas.FitnessClassBulkActionResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+def create_fitness_classes(
+    fitness_classes_data: List[schemas.FitnessClassCreate],
+    db: Session = Depends(database.get_db),
+):
+    return fitness_class_service.create_fitness_classes(db, fitness_classes_data)
+
+
 @router.get(
     "/{fitness_class_id}",
     response_model=schemas.FitnessClassResponse,
     status_code=status.HTTP_200_OK,
 )
-def get_fitness_class(fitness_class_id: str, db: Session = Depends(database.get_db)):
-    return fitness_class_service.get_fitness_class_by_id(db, fitness_class_id)
+def get_fitness_class(
+    fitness_class_id: uuid.UUID, db: Session = Depends(database.get_db)
+):
+    return fitness_class_service.get_fitness_class_by_id(db, str(fitness_class_id))
 
 
 @router.get(
@@ -35,12 +51,21 @@ def get_fitness_class(fitness_class_id: str, db: Session = Depends(database.get_
 )
 def get_fitness_classs(
     timezone: str = Query("Asia/Kolkata"),
+    instructor: Optional[str] = Query(None, description="Instructor name"),
+    date_from: Optional[date] = Query(None, description="Earliest class date"),
+    date_to: Optional[date] = Query(None, description="Latest class date"),
     page: int = 1,
     limit: int = 10,
     db: Session = Depends(database.get_db),
 ):
     return fitness_class_service.get_fitness_classes(
-        db, page=page, limit=limit, timezone=timezone
+        db,
+        page=page,
+        limit=limit,
+        timezone=timezone,
+        instructor=instructor,
+        date_from=date_from,
+        date_to=date_to,
     )
 
 
@@ -50,12 +75,12 @@ def get_fitness_classs(
     status_code=status.HTTP_200_OK,
 )
 def update_fitness_class(
-    fitness_class_id: str,
+    fitness_class_id: uuid.UUID,
     updated_fitness_class_data: schemas.FitnessClassUpdate,
     db: Session = Depends(database.get_db),
 ):
     return fitness_class_service.update_fitness_class(
-        db, fitness_class_id, updated_fitness_class_data
+        db, str(fitness_class_id), updated_fitness_class_data
     )
 
 
@@ -64,5 +89,7 @@ def update_fitness_class(
     response_model=schemas.FitnessClassActionResponse,
     status_code=status.HTTP_200_OK,
 )
-def delete_fitness_class(fitness_class_id: str, db: Session = Depends(database.get_db)):
-    return fitness_class_service.delete_fitness_class(db, fitness_class_id)
+def delete_fitness_class(
+    fitness_class_id: uuid.UUID, db: Session = Depends(database.get_db)
+):
+    return fitness_class_service.delete_fitness_class(db, str(fitness_class_id))
@@ -1,4 +1,5 @@
 from typing import List
+import uuid
 from fastapi import APIRouter, Depends, status
 from sqlalchemy.orm import Session
 from app import schemas, database
@@ -19,8 +20,8 @@ def create_user(user_data: schemas.UserCreate, db: Session = Depends(database.ge
     response_model=schemas.UserResponse,
     status_code=status.HTTP_200_OK,
 )
-def get_user(user_id: str, db: Session = Depends(database.get_db)):
-    return user_service.get_user_by_id(db, user_id)
+def get_user(user_id: uuid.UUID, db: Session = Depends(database.get_db)):
+    return user_service.get_user_by_id(db, str(user_id))
 
 
 @router.get(
@@ -36,11 +37,11 @@ def get_users(page: int = 1, limit: int = 10, db: Session = Depends(database.get
     status_code=status.HTTP_200_OK,
 )
 def update_user(
-    user_id: str,
+    user_id: uuid.UUID,
     updated_user_data: schemas.UserUpdate,
     db: Session = Depends(database.get_db),
 ):
-    return user_service.update_user(db, user_id, updated_user_data)
+    return user_service.update_user(db, str(user_id), updated_user_data)
 
 
 @router.delete(
@@ -48,5 +49,5 @@ def update_user(
     response_model=schemas.UserActionResponse,
     status_code=status.HTTP_200_OK,
 )
-def delete_user(user_id: str, db: Session = Depends(database.get_db)):
-    return user_service.delete_user(db, user_id)
+def delete_user(user_id: uuid.UUID, db: Session = Depends(database.get_db)):
+    return user_service.delete_user(db, str(user_id))
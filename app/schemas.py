@@ -1,6 +1,9 @@
 from pydantic import BaseModel, Field, field_validator
 from datetime import date, datetime, time
-from typing import Optional
+from typing import List, Optional
+import uuid
+
+MAX_CLASS_DURATION_MINUTES = 480
 
 
 # User Schemas
@@ -42,6 +45,7 @@ class FitnessClassBase(BaseModel):
     description: str = Field(default="")
     class_date: date
     start_time: time
+    duration_minutes: int = Field(default=60, ge=1, le=MAX_CLASS_DURATION_MINUTES)
     instructor: str
     available_slots: int = Field(ge=0, le=1000)
 
@@ -59,9 +63,27 @@ class FitnessClassUpdate(BaseModel):
     description: Optional[str] = None
     class_date: Optional[date] = None
     start_time: Optional[time] = None
+    duration_minutes: Optional[int] = Field(
+        default=None, ge=1, le=MAX_CLASS_DURATION_MINUTES
+    )
     instructor: Optional[str] = None
     available_slots: Optional[int] = Field(default=None, ge=0, le=1000)
 
+    @field_validator(
+        "name",
+        "class_date",
+        "start_time",
+        "duration_minutes",
+        "instructor",
+        "available_slots",
+    )
+    @classmethod
+    def reject_null(cls, value):
+        """Fields that are required on the class may be omitted, but not set to null."""
+        if value is None:
+            raise ValueError("may not be null")
+        return value
+
 
 class FitnessClassResponse(FitnessClassBase):
     """Schema for fitness class response."""
@@ -77,10 +99,17 @@ class FitnessClassActionResponse(BaseModel):
     message: str
 
 
+class FitnessClassBulkActionResponse(BaseModel):
+    """Schema for bulk fitness class action response."""
+
+    fitness_class_ids: List[str]
+    message: str
+
+
 # Booking Schemas
 class BookingBase(BaseModel):
-    user_id: str
-    class_id: str
+    user_id: uuid.UUID
+    class_id: uuid.UUID
 
 
 class BookingCreate(BookingBase):
@@ -104,3 +133,36 @@ class BookingActionResponse(BaseModel):
 
     booking_id: str
     message: str
+
+
+# Analytics Schemas
+class ClassBookingStats(BaseModel):
+    """Schema for booking counts of a fitness class."""
+
+    class_id: str
+    bookings: int
+    model_config = {"from_attributes": True}
+
+
+class InstructorBookingStats(BaseModel):
+    """Schema for booking counts of an instructor."""
+
+    instructor: str
+    bookings: int
+    model_config = {"from_attributes": True}
+
+
+class DailyBookingStats(BaseModel):
+    """Schema for booking counts of a single day."""
+
+    booking_date: date
+    bookings: int
+    model_config = {"from_attributes": True}
+
+
+class UserBookingHistory(BaseModel):
+    """Schema for a user's booking counts per day."""
+
+    user_id: str
+    total_bookings: int
+    days: List[DailyBookingStats]
@@ -0,0 +1,255 @@
+from datetime import date
+from sqlalchemy import bindparam, delete, func, insert, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+from app.models import (
+    Booking,
+    FitnessClass,
+    DailyClassBookingRollup,
+    DailyInstructorBookingRollup,
+    DailyUserBookingRollup,
+)
+from app.crud import select_records
+from app.services import user_service
+
+ROLLUP_MODELS = (
+    DailyClassBookingRollup,
+    DailyInstructorBookingRollup,
+    DailyUserBookingRollup,
+)
+
+
+def _increment_rollup(db: Session, model, **key_values):
+    """Add one booking to a rollup row, creating the row if it does not exist."""
+    primary_keys = [column.name for column in model.__table__.primary_key.columns]
+    stmt = sqlite_insert(model).values(**key_values, bookings=1)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=primary_keys, set_={"bookings": model.bookings + 1}
+    )
+    db.execute(stmt)
+
+
+def record_booking(
+    db: Session, booking_date: date, user_id: str, class_id: str, instructor: str
+):
+    """
+    Count a new booking in the daily rollups.
+
+    Runs in the caller's transaction, so the rollups are committed or rolled
+    back together with the booking itself.
+    """
+    _increment_rollup(
+        db, DailyClassBookingRollup, booking_date=booking_date, class_id=class_id
+    )
+    _increment_rollup(
+        db,
+        DailyInstructorBookingRollup,
+        booking_date=booking_date,
+        instructor=instructor,
+    )
+    _increment_rollup(
+        db, DailyUserBookingRollup, booking_date=booking_date, user_id=user_id
+    )
+
+
+def _subtract_from_rollup(db: Session, model, key_columns, counts):
+    """Subtract booking counts from rollup rows and drop rows that reach zero."""
+    if not counts:
+        return
+    table = model.__table__
+    matches_key = [column == bindparam(f"key_{column.key}") for column in key_columns]
+    keys = [
+        {f"key_{column.key}": value for column, value in zip(key_columns, key)}
+        for *key, _ in counts
+    ]
+    # Against the table, so a list of parameters runs as a plain executemany
+    # rather than an ORM bulk update by primary key
+    db.execute(
+        update(table)
+        .where(*matches_key)
+        .values(bookings=table.c.bookings - bindparam("removed")),
+        [{**key, "removed": count[-1]} for key, count in zip(keys, counts)],
+    )
+    db.execute(delete(table).where(*matches_key, table.c.bookings <= 0), keys)
+
+
+def forget_class(db: Session, class_id: str, instructor: str):
+    """
+    Take a deleted class's bookings out of the daily rollups.
+
+    Runs in the caller's transaction, while the class's bookings are still
+    in the bookings table, so the rollups agree with `rebuild_rollups`,
+    which only counts bookings of existing classes.
+    """
+    class_bookings = [Booking.class_id == class_id]
+    per_day = select_records(
+        db,
+        Booking,
+        select_cols=[Booking.booked_at, func.count()],
+        filter_conditions=class_bookings,
+        group_by=[Booking.booked_at],
+    ).all()
+    per_user_day = select_records(
+        db,
+        Booking,
+        select_cols=[Booking.booked_at, Booking.user_id, func.count()],
+        filter_conditions=class_bookings,
+        group_by=[Booking.booked_at, Booking.user_id],
+    ).all()
+
+    db.execute(
+        delete(DailyClassBookingRollup).where(
+            DailyClassBookingRollup.class_id == class_id
+        )
+    )
+    _subtract_from_rollup(
+        db,
+        DailyInstructorBookingRollup,
+        [
+            DailyInstructorBookingRollup.booking_date,
+            DailyInstructorBookingRollup.instructor,
+        ],
+        [(booked_at, instructor, removed) for booked_at, removed in per_day],
+    )
+    _subtract_from_rollup(
+        db,
+        DailyUserBookingRollup,
+        [DailyUserBookingRollup.booking_date, DailyUserBookingRollup.user_id],
+        per_user_day,
+    )
+
+
+def rebuild_rollups(db: Session):
+    """
+    Recompute every rollup table from the bookings table.
+
+    Used to backfill existing data and as a periodic compactor. Bookings are
+    attributed to each class's current instructor, and bookings of deleted
+    classes are left out of every rollup, as `forget_class` does when a
+    class is deleted.
+    """
+    for model in ROLLUP_MODELS:
+        db.execute(delete(model))
+
+    db.execute(
+        insert(DailyClassBookingRollup).from_select(
+            ["booking_date", "class_id", "bookings"],
+            select(Booking.booked_at, Booking.class_id, func.count())
+            .join(FitnessClass, FitnessClass.id == Booking.class_id)
+            .group_by(Booking.booked_at, Booking.class_id),
+        )
+    )
+    db.execute(
+        insert(DailyInstructorBookingRollup).from_select(
+            ["booking_date", "instructor", "bookings"],
+            select(Booking.booked_at, FitnessClass.instructor, func.count())
+            .join(FitnessClass, FitnessClass.id == Booking.class_id)
+            .group_by(Booking.booked_at, FitnessClass.instructor),
+        )
+    )
+    db.execute(
+        insert(DailyUserBookingRollup).from_select(
+            ["booking_date", "user_id", "bookings"],
+            select(Booking.booked_at, Booking.user_id, func.count())
+            .join(FitnessClass, FitnessClass.id == Booking.class_id)
+            .group_by(Booking.booked_at, Booking.user_id),
+        )
+    )
+    db.commit()
+
+
+def _date_filters(model, date_from: date = None, date_to: date = None):
+    filter_conditions = []
+    if date_from:
+        filter_conditions.append(model.booking_date >= date_from)
+    if date_to:
+        filter_conditions.append(model.booking_date <= date_to)
+    return filter_conditions
+
+
+def get_bookings_per_class(
+    db: Session, page: int, limit: int, date_from: date = None, date_to: date = None
+):
+    """Service method to retrieve booking counts per fitness class, busiest first."""
+    offset = (page - 1) * limit
+    bookings = func.sum(DailyClassBookingRollup.bookings).label("bookings")
+    query = select_records(
+        db,
+        DailyClassBookingRollup,
+        select_cols=[DailyClassBookingRollup.class_id, bookings],
+        filter_conditions=_date_filters(DailyClassBookingRollup, date_from, date_to),
+        group_by=[DailyClassBookingRollup.class_id],
+        order_by=[bookings.desc(), DailyClassBookingRollup.class_id],
+        offset=offset,
+        limit=limit,
+    )
+    return query.all()
+
+
+def get_bookings_per_instructor(
+    db: Session, page: int, limit: int, date_from: date = None, date_to: date = None
+):
+    """Service method to retrieve booking counts per instructor, busiest first."""
+    offset = (page - 1) * limit
+    bookings = func.sum(DailyInstructorBookingRollup.bookings).label("bookings")
+    query = select_records(
+        db,
+        DailyInstructorBookingRollup,
+        select_cols=[DailyInstructorBookingRollup.instructor, bookings],
+        filter_conditions=_date_filters(
+            DailyInstructorBookingRollup, date_from, date_to
+        ),
+        group_by=[DailyInstructorBookingRollup.instructor],
+        order_by=[bookings.desc(), DailyInstructorBookingRollup.instructor],
+        offset=offset,
+        limit=limit,
+    )
+    return query.all()
+
+
+def get_bookings_per_day(
+    db: Session, page: int, limit: int, date_from: date = None, date_to: date = None
+):
+    """Service method to retrieve booking counts per day, oldest first."""
+    offset = (page - 1) * limit
+    query = select_records(
+        db,
+        DailyInstructorBookingRollup,
+        select_cols=[
+            DailyInstructorBookingRollup.booking_date,
+            func.sum(DailyInstructorBookingRollup.bookings).label("bookings"),
+        ],
+        filter_conditions=_date_filters(
+            DailyInstructorBookingRollup, date_from, date_to
+        ),
+        group_by=[DailyInstructorBookingRollup.booking_date],
+        order_by=[DailyInstructorBookingRollup.booking_date],
+        offset=offset,
+        limit=limit,
+    )
+    return query.all()
+
+
+def get_user_booking_history(
+    db: Session, user_id: str, date_from: date = None, date_to: date = None
+):
+    """Service method to retrieve a user's booking counts per day."""
+    user_service.get_user_by_id(db, user_id)  # Check whether user with ID exists
+    filter_conditions = [DailyUserBookingRollup.user_id == user_id]
+    filter_conditions += _date_filters(DailyUserBookingRollup, date_from, date_to)
+    query = select_records(
+        db,
+        DailyUserBookingRollup,
+        select_cols=[
+            DailyUserBookingRollup.booking_date,
+            DailyUserBookingRollup.bookings,
+        ],
+        filter_conditions=filter_conditions,
+        order_by=[DailyUserBookingRollup.booking_date],
+    )
+    days = query.all()
+    return {
+        "user_id": user_id,
+        "total_bookings": sum(day.bookings for day in days),
+        "days": days,
+    }
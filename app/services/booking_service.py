@@ -5,7 +5,8 @@ from app.models import Booking, FitnessClass, User
 from app.schemas import BookingCreate, BookingActionResponse, BookingResponse
 from app.crud import select_records, insert_record, update_records, delete_record
 from app.exception import RecordNotFound, RecordExists, BadRequestException
-from app.services import fitness_class_service
+from app.services import fitness_class_service, analytics_service
+from app.services.schedule_snapshot import schedule_snapshot
 
 
 def create_booking(db: Session, booking: BookingCreate):
@@ -22,9 +23,19 @@ def create_booking(db: Session, booking: BookingCreate):
             user_id=booking.user_id, class_id=booking.class_id, booked_at=date.today()
         )
         fitness_class.available_slots -= 1
+        available_slots = fitness_class.available_slots
+        fitness_class_id = fitness_class.id
         db.add(new_booking)
+        analytics_service.record_booking(
+            db,
+            booking_date=new_booking.booked_at,
+            user_id=booking.user_id,
+            class_id=booking.class_id,
+            instructor=fitness_class.instructor,
+        )
         db.commit()
         db.refresh(new_booking)
+        schedule_snapshot.update_available_slots(fitness_class_id, available_slots)
 
         return {
             "booking_id": new_booking.id,
@@ -1,17 +1,33 @@
 from datetime import date, datetime, time
+from typing import List
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from app.models import FitnessClass
 from app.schemas import FitnessClassCreate, FitnessClassResponse, FitnessClassUpdate
-from app.crud import select_records, insert_record, update_records, delete_record
+from app.crud import (
+    select_record_by_id,
+    insert_record,
+    insert_records,
+    update_records,
+    delete_record,
+)
 from app.exception import RecordNotFound, RecordExists
+from app.services import analytics_service
+from app.services.schedule_conflicts import (
+    InstructorIntervalIndex,
+    ScheduledClass,
+    class_interval,
+    find_schedule_conflicts,
+)
+from app.services.schedule_snapshot import schedule_row, schedule_snapshot
 from fastapi import HTTPException, status
-import pytz
 
 
 def convert_ist_to_timezone(
     class_date: date, start_time: time, target_timezone_str: str
 ):
+    import pytz  # imported lazily to keep it off the startup path
+
     # Timezones
     ist = pytz.timezone("Asia/Kolkata")
     if target_timezone_str not in pytz.all_timezones:
@@ -32,6 +48,17 @@ def convert_ist_to_timezone(
     return adjusted_date, adjusted_time
 
 
+def reject_schedule_conflicts(db: Session, fitness_classes):
+    """Roll back and raise RecordExists if a flushed class overlaps another class of its instructor."""
+    conflicts = find_schedule_conflicts(db, fitness_classes)
+    if conflicts:
+        db.rollback()
+        _, conflicting_id = conflicts[0]
+        raise RecordExists(
+            msg=f"Instructor is already scheduled during that time (fitness class {conflicting_id})"
+        )
+
+
 def create_fitness_class(db: Session, fitness_class_data: FitnessClassCreate):
     """Service method to create a fitness class."""
     try:
@@ -39,8 +66,13 @@ def create_fitness_class(db: Session, fitness_class_data: FitnessClassCreate):
             **fitness_class_data.model_dump(exclude_unset=True)
         )
         db.add(fitness_class_record)
+        # Flushing first takes SQLite's write lock, so concurrent writers
+        # queue behind this transaction and see its class when they check
+        db.flush()
+        reject_schedule_conflicts(db, [fitness_class_record])
         db.commit()
         db.refresh(fitness_class_record)
+        schedule_snapshot.upsert(fitness_class_record)
 
         return {
             "fitness_class_id": fitness_class_record.id,
@@ -51,11 +83,52 @@ def create_fitness_class(db: Session, fitness_class_data: FitnessClassCreate):
         raise RecordExists(msg="Instructor is already scheduled at that date and time")
 
 
+def create_fitness_classes(db: Session, fitness_classes_data: List[FitnessClassCreate]):
+    """Service method to create several fitness classes in one transaction."""
+    # Report overlaps within the request by position before writing anything
+    batch_intervals = {}
+    for position, fitness_class_data in enumerate(fitness_classes_data):
+        start, end = class_interval(
+            fitness_class_data.class_date,
+            fitness_class_data.start_time,
+            fitness_class_data.duration_minutes,
+        )
+        intervals = batch_intervals.setdefault(
+            fitness_class_data.instructor, InstructorIntervalIndex()
+        )
+        overlapping = intervals.overlapping(start, end)
+        if overlapping:
+            raise RecordExists(
+                msg=f"Fitness classes {overlapping[0]} and {position} in the request overlap for the same instructor"
+            )
+        intervals.add(str(position), start, end)
+
+    try:
+        fitness_class_records = insert_records(
+            db,
+            FitnessClass,
+            [data.model_dump(exclude_unset=True) for data in fitness_classes_data],
+        )
+        reject_schedule_conflicts(db, fitness_class_records)
+        # Copy the rows before commit expires the records
+        rows = [schedule_row(record) for record in fitness_class_records]
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise RecordExists(msg="Instructor is already scheduled at that date and time")
+
+    for row in rows:
+        schedule_snapshot.upsert(row)
+
+    return {
+        "fitness_class_ids": [row.id for row in rows],
+        "message": f"Successfully created {len(rows)} fitness class records",
+    }
+
+
 def get_fitness_class_by_id(db: Session, fitness_class_id: str):
     """Service method to retrieve a fitness class by ID."""
-    filter_conditions = [FitnessClass.id == fitness_class_id]
-    query = select_records(db, FitnessClass, filter_conditions=filter_conditions)
-    fitness_class = query.first()
+    fitness_class = select_record_by_id(db, FitnessClass, fitness_class_id)
 
     if not fitness_class:
         raise RecordNotFound(
@@ -65,15 +138,30 @@ def get_fitness_class_by_id(db: Session, fitness_class_id: str):
 
 
 def get_fitness_classes(
-    db: Session, page: int, limit: int, timezone: str = "Asia/Kolkata"
+    db: Session,
+    page: int,
+    limit: int,
+    timezone: str = "Asia/Kolkata",
+    instructor: str = None,
+    date_from: date = None,
+    date_to: date = None,
 ):
     """Service method to retrieve a list of fitness classs."""
+    import pytz
+
     if timezone not in pytz.all_timezones:
         raise ValueError("Invalid timezone")
 
+    # Listings are served from the in-memory schedule snapshot instead of SQL
     offset = (page - 1) * limit
-    query = select_records(db, FitnessClass, offset=offset, limit=limit)
-    fitness_classes = query.all()
+    schedule_snapshot.ensure_loaded(db)
+    fitness_classes = schedule_snapshot.list_classes(
+        offset=offset,
+        limit=limit,
+        instructor=instructor,
+        date_from=date_from,
+        date_to=date_to,
+    )
 
     result = []
     for fc in fitness_classes:
@@ -87,6 +175,7 @@ def get_fitness_classes(
                 description=fc.description,
                 class_date=adjusted_date,
                 start_time=adjusted_time.strftime("%H:%M"),
+                duration_minutes=fc.duration_minutes,
                 instructor=fc.instructor,
                 available_slots=fc.available_slots,
             )
@@ -99,38 +188,49 @@ def update_fitness_class(
     db: Session, fitness_class_id: str, updated_fitness_class_data: FitnessClassUpdate
 ):
     """Service method to update a fitness class's details."""
+    fitness_class = get_fitness_class_by_id(
+        db, fitness_class_id
+    )  # Check whether fitness class with ID exists
+    records_to_update = updated_fitness_class_data.model_dump(exclude_unset=True)
+    scheduled_class = ScheduledClass(
+        id=fitness_class.id,
+        **{
+            key: records_to_update.get(key, getattr(fitness_class, key))
+            for key in ScheduledClass._fields[1:]
+        },
+    )
     try:
-        get_fitness_class_by_id(
-            db, fitness_class_id
-        )  # Check whether fitness class with ID exists
         filter_criteria = [FitnessClass.id == fitness_class_id]
-        records_to_update = updated_fitness_class_data.model_dump(exclude_unset=True)
         update_records(
             db,
             FitnessClass,
             filter_criteria=filter_criteria,
             records_to_update=records_to_update,
         )
+        reject_schedule_conflicts(db, [scheduled_class])
         db.commit()
+        schedule_snapshot.upsert(get_fitness_class_by_id(db, scheduled_class.id))
         return {
             "fitness_class_id": fitness_class_id,
             "message": "Successfully updated fitness class record",
         }
     except IntegrityError:
         db.rollback()
-        raise RecordExists(
-            msg="A fitness class with this email already exists.",
-        )
+        raise RecordExists(msg="Instructor is already scheduled at that date and time")
 
 
 def delete_fitness_class(db: Session, fitness_class_id: str):
     """Service method to delete a fitness class."""
-    get_fitness_class_by_id(
+    fitness_class = get_fitness_class_by_id(
         db, fitness_class_id
     )  # Check whether fitness class with ID exists
+    # Key in-memory state on the stored ID, not on the request's spelling of it
+    stored_id = fitness_class.id
+    analytics_service.forget_class(db, stored_id, fitness_class.instructor)
     filter_criteria = [FitnessClass.id == fitness_class_id]
     delete_record(db, FitnessClass, filter_criteria)
     db.commit()
+    schedule_snapshot.remove(stored_id)
     return {
         "fitness_class_id": fitness_class_id,
         "message": "Successfully deleted fitness class record",
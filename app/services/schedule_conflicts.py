@@ -0,0 +1,162 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import namedtuple
+from datetime import date, time
+from sqlalchemy import Date, Time, bindparam, select, tuple_
+from sqlalchemy.orm import Session
+from app.models import FitnessClass
+from app.schemas import MAX_CLASS_DURATION_MINUTES
+
+MINUTES_PER_DAY = 1440
+
+INDEX_COLUMNS = (
+    FitnessClass.id,
+    FitnessClass.instructor,
+    FitnessClass.class_date,
+    FitnessClass.start_time,
+    FitnessClass.duration_minutes,
+)
+
+# One instructor's classes starting strictly inside a (date, time) window.
+# The row-value bounds make SQLite seek the uix_instructor_schedule index on
+# (instructor, class_date, start_time) instead of scanning whole days. Built
+# once and executed with bound parameters, like select_record_by_id.
+_class_start = tuple_(FitnessClass.class_date, FitnessClass.start_time)
+WINDOW_QUERY = select(*INDEX_COLUMNS).where(
+    FitnessClass.instructor == bindparam("instructor"),
+    _class_start
+    > tuple_(bindparam("after_date", type_=Date), bindparam("after_time", type_=Time)),
+    _class_start
+    < tuple_(
+        bindparam("before_date", type_=Date), bindparam("before_time", type_=Time)
+    ),
+)
+
+ScheduledClass = namedtuple(
+    "ScheduledClass",
+    ["id", "instructor", "class_date", "start_time", "duration_minutes"],
+)
+
+
+def class_interval(class_date: date, start_time: time, duration_minutes: int):
+    """Return a class's [start, end) in absolute minutes, so classes may cross midnight."""
+    start = (
+        class_date.toordinal() * MINUTES_PER_DAY
+        + start_time.hour * 60
+        + start_time.minute
+    )
+    return start, start + duration_minutes
+
+
+def _minute_to_date_time(minute: int):
+    day, minute = divmod(minute, MINUTES_PER_DAY)
+    return date.fromordinal(day), time(minute // 60, minute % 60)
+
+
+def search_windows(fitness_classes):
+    """
+    Return, per instructor, the merged minute windows that classes
+    overlapping the given ones must start in.
+
+    A class overlapping [start, end) starts after start minus the longest
+    allowed duration and before end. Overlapping windows of the same
+    instructor are merged so each stored class is read at most once.
+    """
+    windows = {}
+    for fc in fitness_classes:
+        start, end = class_interval(fc.class_date, fc.start_time, fc.duration_minutes)
+        windows.setdefault(fc.instructor, []).append(
+            (start - MAX_CLASS_DURATION_MINUTES, end)
+        )
+
+    for instructor, ranges in windows.items():
+        ranges.sort()
+        merged = [ranges[0]]
+        for after, before in ranges[1:]:
+            if after < merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], before))
+            else:
+                merged.append((after, before))
+        windows[instructor] = merged
+    return windows
+
+
+class InstructorIntervalIndex:
+    """
+    One instructor's classes as [start, end) minute intervals sorted by start.
+
+    Any interval overlapping [start, end) must begin after
+    start - max_duration and before end, so a lookup is two bisections plus
+    a scan over that narrow window.
+    """
+
+    def __init__(self) -> None:
+        self.starts = array("q")
+        self.ends = array("q")
+        self.class_ids = []
+        self.max_duration = 0
+
+    def __len__(self) -> int:
+        return len(self.class_ids)
+
+    def add(self, class_id: str, start: int, end: int) -> None:
+        position = bisect_right(self.starts, start)
+        self.starts.insert(position, start)
+        self.ends.insert(position, end)
+        self.class_ids.insert(position, class_id)
+        self.max_duration = max(self.max_duration, end - start)
+
+    def overlapping(self, start: int, end: int, exclude_id: str = None):
+        """Return the ids of classes overlapping [start, end)."""
+        low = bisect_right(self.starts, start - self.max_duration)
+        high = bisect_left(self.starts, end)
+        return [
+            self.class_ids[position]
+            for position in range(low, high)
+            if self.ends[position] > start and self.class_ids[position] != exclude_id
+        ]
+
+
+def find_schedule_conflicts(db: Session, fitness_classes):
+    """
+    Find classes that overlap another class of the same instructor.
+
+    Meant to run inside the write transaction once the classes have been
+    flushed, so the check sees the committed schedule of every worker plus
+    this transaction's own writes. Only the classes that could overlap are
+    read, with one indexed range query per merged search window, and they
+    are checked with an interval index per instructor.
+    Args:
+        db (Session): The SQLAlchemy database db.
+        fitness_classes (list): FitnessClass records or ScheduledClass tuples to check.
+    Returns:
+        list of tuple: (class id, id of a class it overlaps) for each conflict.
+    """
+    indexes = {}
+    for instructor, windows in search_windows(fitness_classes).items():
+        intervals = indexes[instructor] = InstructorIntervalIndex()
+        for after, before in windows:
+            after_date, after_time = _minute_to_date_time(after)
+            before_date, before_time = _minute_to_date_time(before)
+            rows = db.execute(
+                WINDOW_QUERY,
+                {
+                    "instructor": instructor,
+                    "after_date": after_date,
+                    "after_time": after_time,
+                    "before_date": before_date,
+                    "before_time": before_time,
+                },
+            )
+            for class_id, _, class_date, start_time, duration in rows:
+                intervals.add(
+                    class_id, *class_interval(class_date, start_time, duration)
+                )
+
+    conflicts = []
+    for fc in fitness_classes:
+        start, end = class_interval(fc.class_date, fc.start_time, fc.duration_minutes)
+        overlapping = indexes[fc.instructor].overlapping(start, end, exclude_id=fc.id)
+        if overlapping:
+            conflicts.append((fc.id, overlapping[0]))
+    return conflicts
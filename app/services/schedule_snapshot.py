@@ -0,0 +1,404 @@
+import os
+import sys
+import threading
+import time as clock
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import namedtuple
+from datetime import date, time
+from sqlalchemy.orm import Session
+from app.models import FitnessClass
+from app.crud import select_records
+
+SECONDS_PER_DAY = 86400
+
+# Reload from the database after this many seconds, to pick up writes made by
+# other worker processes or outside the API
+SNAPSHOT_MAX_AGE_SECONDS = float(os.getenv("FITSTUDIO_SNAPSHOT_MAX_AGE", "30"))
+
+SNAPSHOT_COLUMNS = (
+    FitnessClass.id,
+    FitnessClass.name,
+    FitnessClass.description,
+    FitnessClass.instructor,
+    FitnessClass.class_date,
+    FitnessClass.start_time,
+    FitnessClass.duration_minutes,
+    FitnessClass.available_slots,
+)
+
+ScheduleRow = namedtuple(
+    "ScheduleRow",
+    [
+        "id",
+        "name",
+        "description",
+        "instructor",
+        "class_date",
+        "start_time",
+        "duration_minutes",
+        "available_slots",
+    ],
+)
+
+
+def schedule_row(fitness_class) -> ScheduleRow:
+    """Copy the snapshot columns of a FitnessClass into a detached ScheduleRow."""
+    return ScheduleRow(*(getattr(fitness_class, col.key) for col in SNAPSHOT_COLUMNS))
+
+
+def _intern(value):
+    """Intern repeated strings (class names, descriptions) so rows share them."""
+    if isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+
+def _time_to_seconds(value: time) -> int:
+    return value.hour * 3600 + value.minute * 60 + value.second
+
+
+def _seconds_to_time(value: int) -> time:
+    return time(value // 3600, (value // 60) % 60, value % 60)
+
+
+def _sort_key(class_date: date, start_time: time) -> int:
+    """Pack a class's date and start time into a single sortable integer."""
+    return class_date.toordinal() * SECONDS_PER_DAY + _time_to_seconds(start_time)
+
+
+def _order_insert(keys: array, rows: array, key: int, row: int) -> None:
+    position = bisect_right(keys, key)
+    keys.insert(position, key)
+    rows.insert(position, row)
+
+
+def _order_delete(keys: array, rows: array, key: int, row: int) -> None:
+    position = bisect_left(keys, key)
+    while rows[position] != row:
+        position += 1
+    del keys[position]
+    del rows[position]
+
+
+class ScheduleSnapshot:
+    """
+    In-process, column-oriented copy of the fitness class schedule.
+
+    Only the scalar columns needed to list classes are kept. Dates, times,
+    slots and instructor ids live in typed arrays, strings are interned, and
+    a key array sorted by (class_date, start_time) serves filtered, sorted
+    and paged listings without going through SQL or the ORM identity map.
+
+    The snapshot is loaded from the database on first use and kept current
+    by the fitness class and booking services calling `upsert`, `remove`
+    and `update_available_slots` after each committed write. Writes made by
+    other processes show up once the snapshot is older than `max_age`
+    seconds and gets reloaded. A reload builds new columns without holding
+    the lock and swaps them in at the end, so listings keep being served
+    from the current snapshot meanwhile.
+    """
+
+    # Attributes holding the snapshot contents, swapped in as a unit on reload
+    _STATE = (
+        "_ids",
+        "_names",
+        "_descriptions",
+        "_instructor_ids",
+        "_dates",
+        "_times",
+        "_durations",
+        "_slots",
+        "_free_rows",
+        "_rows",
+        "_instructors",
+        "_instructor_lookup",
+        "_order_keys",
+        "_order_rows",
+        "_instructor_order",
+    )
+
+    def __init__(self, max_age: float = SNAPSHOT_MAX_AGE_SECONDS) -> None:
+        self.max_age = max_age
+        self._lock = threading.RLock()
+        # Held by the one caller rebuilding the snapshot
+        self._reload_lock = threading.Lock()
+        # Writes made while a rebuild is reading the table, replayed on swap
+        self._journal = None
+        self._loaded = False
+        self._loaded_at = 0.0
+        self._reset()
+
+    def _reset(self) -> None:
+        # Column storage, one slot per row. Freed rows are reused.
+        self._ids = []
+        self._names = []
+        self._descriptions = []
+        self._instructor_ids = array("l")
+        self._dates = array("l")  # date.toordinal()
+        self._times = array("l")  # seconds since midnight
+        self._durations = array("l")  # minutes
+        self._slots = array("l")
+        self._free_rows = []
+        self._rows = {}  # class id -> row index
+
+        # Interned instructor names, addressed by a small integer id.
+        self._instructors = []
+        self._instructor_lookup = {}
+
+        # Live rows ordered by (class_date, start_time), overall and for
+        # each instructor id, so both listings are a bisect and a slice.
+        self._order_keys = array("q")
+        self._order_rows = array("l")
+        self._instructor_order = []  # instructor id -> (keys, rows)
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    @property
+    def stale(self) -> bool:
+        return clock.monotonic() - self._loaded_at > self.max_age
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def load(self, db: Session) -> None:
+        """Rebuild the snapshot from the fitness_classes table."""
+        with self._reload_lock:
+            self._rebuild(db)
+
+    def ensure_loaded(self, db: Session) -> None:
+        """
+        Load the snapshot on first use and refresh it once it has gone stale.
+
+        Only the first load makes callers wait. A stale snapshot is rebuilt by
+        whichever caller notices first while the others keep reading it.
+        """
+        if not self._loaded:
+            with self._reload_lock:
+                if not self._loaded:
+                    self._rebuild(db)
+        elif self.stale and self._reload_lock.acquire(blocking=False):
+            try:
+                if self.stale:
+                    self._rebuild(db)
+            finally:
+                self._reload_lock.release()
+
+    def invalidate(self) -> None:
+        """Drop the snapshot so the next listing reloads it from the database."""
+        with self._lock:
+            self._loaded = False
+            self._journal = None
+            self._reset()
+
+    def upsert(self, fitness_class) -> None:
+        """Insert or replace a class. Accepts a FitnessClass or any object with the same attributes."""
+        row = schedule_row(fitness_class)
+        self._write(self._upsert, row)
+
+    def remove(self, fitness_class_id: str) -> None:
+        """Remove a class from the snapshot if present."""
+        self._write(self._remove, fitness_class_id)
+
+    def update_available_slots(
+        self, fitness_class_id: str, available_slots: int
+    ) -> None:
+        """Update the slot count of a class after a booking."""
+        self._write(self._update_available_slots, fitness_class_id, available_slots)
+
+    def _write(self, apply, *args) -> None:
+        with self._lock:
+            if self._journal is not None:
+                self._journal.append((apply, args))
+            if self._loaded:
+                apply(*args)
+
+    def _upsert(self, row: ScheduleRow) -> None:
+        if row.id in self._rows:
+            self._delete(row.id)
+        self._insert(row)
+
+    def _remove(self, fitness_class_id: str) -> None:
+        if fitness_class_id in self._rows:
+            self._delete(fitness_class_id)
+
+    def _update_available_slots(
+        self, fitness_class_id: str, available_slots: int
+    ) -> None:
+        row = self._rows.get(fitness_class_id)
+        if row is not None:
+            self._slots[row] = available_slots
+
+    def _rebuild(self, db: Session) -> None:
+        """Build fresh columns outside the lock, then swap them in. Caller holds _reload_lock."""
+        with self._lock:
+            self._journal = []
+        loaded_at = clock.monotonic()
+        try:
+            query = select_records(db, FitnessClass, select_cols=SNAPSHOT_COLUMNS)
+            fresh = ScheduleSnapshot(self.max_age)
+            fresh._build(query.all())
+        except Exception:
+            with self._lock:
+                self._journal = None
+            raise
+
+        with self._lock:
+            if self._journal is None:  # invalidated while rebuilding
+                return
+            for name in self._STATE:
+                setattr(self, name, getattr(fresh, name))
+            # The writes may or may not be in what was read; replaying them
+            # is safe either way
+            for apply, args in self._journal:
+                apply(*args)
+            self._journal = None
+            self._loaded = True
+            self._loaded_at = loaded_at
+
+    def _build(self, records) -> None:
+        """Fill empty columns from records a column at a time, sorting the order arrays once."""
+        records = list(records)
+        if not records:
+            return
+        ids, names, descriptions, instructors, dates, times, durations, slots = zip(
+            *records
+        )
+        self._ids = list(ids)
+        self._names = [_intern(name) for name in names]
+        self._descriptions = [_intern(description) for description in descriptions]
+        self._instructor_ids = array("l", map(self._instructor_id, instructors))
+        self._dates = array("l", [class_date.toordinal() for class_date in dates])
+        self._times = array("l", map(_time_to_seconds, times))
+        self._durations = array("l", durations)
+        self._slots = array("l", slots)
+        self._rows = {class_id: row for row, class_id in enumerate(ids)}
+
+        keys = [
+            day * SECONDS_PER_DAY + seconds
+            for day, seconds in zip(self._dates, self._times)
+        ]
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        self._order_keys = array("q", [keys[row] for row in order])
+        self._order_rows = array("l", order)
+        for row in order:
+            instructor_keys, instructor_rows = self._instructor_order[
+                self._instructor_ids[row]
+            ]
+            instructor_keys.append(keys[row])
+            instructor_rows.append(row)
+
+    def list_classes(
+        self,
+        offset: int = 0,
+        limit: int = None,
+        instructor: str = None,
+        date_from: date = None,
+        date_to: date = None,
+    ):
+        """
+        Return classes ordered by date and start time.
+        Args:
+            offset (int): Number of matching classes to skip.
+            limit (int): Maximum number of classes to return.
+            instructor (str): Only return classes taught by this instructor.
+            date_from (date): Only return classes on or after this date.
+            date_to (date): Only return classes on or before this date.
+        Returns:
+            list of ScheduleRow: The matching classes.
+        """
+        with self._lock:
+            if instructor is None:
+                keys, order = self._order_keys, self._order_rows
+            else:
+                instructor_id = self._instructor_lookup.get(instructor)
+                if instructor_id is None:
+                    return []
+                keys, order = self._instructor_order[instructor_id]
+
+            start = 0
+            end = len(keys)
+            if date_from is not None:
+                start = bisect_left(keys, date_from.toordinal() * SECONDS_PER_DAY)
+            if date_to is not None:
+                end = bisect_left(keys, (date_to.toordinal() + 1) * SECONDS_PER_DAY)
+
+            start += max(offset, 0)
+            stop = end if limit is None else min(end, start + limit)
+            return [self._row(row) for row in order[start:stop]]
+
+    def _row(self, row: int) -> ScheduleRow:
+        return ScheduleRow(
+            id=self._ids[row],
+            name=self._names[row],
+            description=self._descriptions[row],
+            instructor=self._instructors[self._instructor_ids[row]],
+            class_date=date.fromordinal(self._dates[row]),
+            start_time=_seconds_to_time(self._times[row]),
+            duration_minutes=self._durations[row],
+            available_slots=self._slots[row],
+        )
+
+    def _instructor_id(self, instructor: str) -> int:
+        instructor_id = self._instructor_lookup.get(instructor)
+        if instructor_id is None:
+            instructor_id = len(self._instructors)
+            self._instructors.append(_intern(instructor))
+            self._instructor_lookup[instructor] = instructor_id
+            self._instructor_order.append((array("q"), array("l")))
+        return instructor_id
+
+    def _insert(self, record: ScheduleRow) -> None:
+        row = self._store(record)
+        key = _sort_key(record.class_date, record.start_time)
+        _order_insert(self._order_keys, self._order_rows, key, row)
+        _order_insert(*self._instructor_order[self._instructor_ids[row]], key, row)
+
+    def _store(self, record: ScheduleRow) -> int:
+        """Write a record's columns into a free or new row and return the row."""
+        values = (
+            record.id,
+            _intern(record.name),
+            _intern(record.description),
+            self._instructor_id(record.instructor),
+            record.class_date.toordinal(),
+            _time_to_seconds(record.start_time),
+            record.duration_minutes,
+            record.available_slots,
+        )
+        columns = (
+            self._ids,
+            self._names,
+            self._descriptions,
+            self._instructor_ids,
+            self._dates,
+            self._times,
+            self._durations,
+            self._slots,
+        )
+        if self._free_rows:
+            row = self._free_rows.pop()
+            for column, value in zip(columns, values):
+                column[row] = value
+        else:
+            row = len(self._ids)
+            for column, value in zip(columns, values):
+                column.append(value)
+        self._rows[record.id] = row
+        return row
+
+    def _delete(self, fitness_class_id: str) -> None:
+        row = self._rows.pop(fitness_class_id)
+        key = self._dates[row] * SECONDS_PER_DAY + self._times[row]
+        _order_delete(self._order_keys, self._order_rows, key, row)
+        _order_delete(*self._instructor_order[self._instructor_ids[row]], key, row)
+
+        self._ids[row] = None
+        self._names[row] = None
+        self._descriptions[row] = None
+        self._free_rows.append(row)
+
+
+schedule_snapshot = ScheduleSnapshot()
@@ -2,7 +2,13 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from app.models import User
 from app.schemas import UserCreate, UserResponse, UserUpdate
-from app.crud import select_records, insert_record, update_records, delete_record
+from app.crud import (
+    select_records,
+    select_record_by_id,
+    insert_record,
+    update_records,
+    delete_record,
+)
 from app.exception import RecordNotFound, RecordExists
 from fastapi import HTTPException, status
 
@@ -29,9 +35,7 @@ def create_user(db: Session, user_data: UserCreate):
 
 def get_user_by_id(db: Session, user_id: str):
     """Service method to retrieve a user by ID."""
-    filter_conditions = [User.id == user_id]
-    query = select_records(db, User, filter_conditions=filter_conditions)
-    user = query.first()
+    user = select_record_by_id(db, User, user_id)
 
     if not user:
         raise RecordNotFound(
@@ -0,0 +1,109 @@
+"""
+Measure instructor schedule conflict checks against large schedules.
+
+Seeds a database, then times the range query and interval check run inside
+the write transaction for single classes (as on create/update) and for one
+bulk import batch.
+
+Run from the repository root:
+    python -m benchmarks.bench_schedule_conflicts --classes 1000000
+"""
+
+import argparse
+import random
+import statistics
+import time
+from datetime import date, timedelta, time as dt_time
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from app.database import Base
+from app.models import FitnessClass, uuid7
+from app.services.schedule_conflicts import ScheduledClass, find_schedule_conflicts
+
+BATCH_SIZE = 50_000
+
+
+def seed(db, count, instructors):
+    # Each instructor teaches back-to-back 60 minute classes from 06:00
+    classes_per_day = 14
+    start = date.today()
+    rows = []
+    for i in range(count):
+        slot = i // len(instructors)
+        rows.append(
+            {
+                "id": uuid7(),
+                "name": "Yoga",
+                "description": "",
+                "instructor": instructors[i % len(instructors)],
+                "class_date": start + timedelta(days=slot // classes_per_day),
+                "start_time": dt_time(6 + slot % classes_per_day, 0),
+                "duration_minutes": 60,
+                "available_slots": 20,
+            }
+        )
+        if len(rows) == BATCH_SIZE:
+            db.execute(insert(FitnessClass), rows)
+            rows = []
+    if rows:
+        db.execute(insert(FitnessClass), rows)
+    db.commit()
+    return start, count // len(instructors) // classes_per_day
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--classes", type=int, default=1_000_000)
+    parser.add_argument("--instructors", type=int, default=500)
+    parser.add_argument("--checks", type=int, default=10_000)
+    parser.add_argument("--bulk", type=int, default=1_000)
+    args = parser.parse_args()
+
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    db = Session()
+    instructors = [f"Instructor {i}" for i in range(args.instructors)]
+    first_day, days = seed(db, args.classes, instructors)
+
+    proposals = [
+        ScheduledClass(
+            id=None,
+            instructor=random.choice(instructors),
+            class_date=first_day + timedelta(days=random.randrange(max(days, 1) + 30)),
+            start_time=dt_time(random.randrange(5, 22), random.choice((0, 15, 30, 45))),
+            duration_minutes=random.choice((30, 45, 60, 90)),
+        )
+        for _ in range(args.checks)
+    ]
+
+    timings = []
+    conflicts = 0
+    for proposal in proposals:
+        started = time.perf_counter()
+        if find_schedule_conflicts(db, [proposal]):
+            conflicts += 1
+        timings.append(time.perf_counter() - started)
+    timings.sort()
+
+    started = time.perf_counter()
+    find_schedule_conflicts(db, proposals[: args.bulk])
+    bulk_seconds = time.perf_counter() - started
+
+    print(
+        f"classes seeded:      {args.classes:,} across {args.instructors} instructors"
+    )
+    print(f"single check p50:    {statistics.median(timings) * 1e6:.1f} us")
+    print(f"single check p99:    {timings[int(len(timings) * 0.99)] * 1e6:.1f} us")
+    print(f"conflicts found:     {conflicts:,} of {args.checks:,}")
+    print(f"bulk import check:   {bulk_seconds * 1e3:.1f} ms for {args.bulk:,} classes")
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+Compare class listing through the ORM with the in-memory schedule snapshot.
+
+Also times a full snapshot reload. Pass --shuffle to store the rows out of
+date order.
+
+Run from the repository root:
+    python -m benchmarks.bench_schedule_snapshot --classes 100000
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+import uuid
+from datetime import date, timedelta, time as dt_time
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from app.database import Base
+from app.models import FitnessClass
+from app.services.schedule_snapshot import ScheduleSnapshot
+
+CLASS_NAMES = ["Yoga", "Zumba", "HIIT", "Pilates", "Spin", "Boxing", "Barre"]
+
+
+def seed(db, count, shuffle=False):
+    instructors = [f"Instructor {i}" for i in range(200)]
+    start = date.today()
+    rows = []
+    for i in range(count):
+        rows.append(
+            {
+                "id": str(uuid.uuid4()),
+                "name": random.choice(CLASS_NAMES),
+                "description": "",
+                "instructor": instructors[i % len(instructors)],
+                "class_date": start + timedelta(days=i // 500),
+                "start_time": dt_time(6 + (i % 15), 0),
+                "available_slots": random.randint(0, 30),
+            }
+        )
+    if shuffle:
+        random.shuffle(rows)
+    db.execute(insert(FitnessClass), rows)
+    db.commit()
+
+
+def measure_memory(fn):
+    tracemalloc.start()
+    result = fn()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current
+
+
+def time_per_call(fn, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - started) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--classes", type=int, default=100_000)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--shuffle", action="store_true")
+    args = parser.parse_args()
+
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    db = Session()
+    seed(db, args.classes, args.shuffle)
+
+    # Memory: all classes as ORM objects vs the columnar snapshot
+    orm_objects, orm_bytes = measure_memory(lambda: db.query(FitnessClass).all())
+    del orm_objects
+    db.expunge_all()
+
+    snapshot = ScheduleSnapshot()
+    _, snapshot_bytes = measure_memory(lambda: snapshot.load(db))
+    reload_latency = time_per_call(lambda: snapshot.load(db), 3)
+
+    offset = args.classes // 2
+    instructor = "Instructor 7"
+    date_from = date.today() + timedelta(days=10)
+
+    def orm_page():
+        db.query(FitnessClass).order_by(
+            FitnessClass.class_date, FitnessClass.start_time
+        ).offset(offset).limit(args.limit).all()
+        db.expunge_all()
+
+    def orm_filtered():
+        db.query(FitnessClass).filter(
+            FitnessClass.instructor == instructor,
+            FitnessClass.class_date >= date_from,
+        ).order_by(FitnessClass.class_date, FitnessClass.start_time).limit(
+            args.limit
+        ).all()
+        db.expunge_all()
+
+    def snapshot_page():
+        snapshot.list_classes(offset=offset, limit=args.limit)
+
+    def snapshot_filtered():
+        snapshot.list_classes(
+            limit=args.limit, instructor=instructor, date_from=date_from
+        )
+
+    scale = 100_000 / args.classes
+    print(f"classes: {args.classes}")
+    print(f"memory per 100k classes, ORM objects: {orm_bytes * scale / 2**20:.1f} MiB")
+    print(
+        f"memory per 100k classes, snapshot:    {snapshot_bytes * scale / 2**20:.1f} MiB"
+    )
+    print(f"snapshot reload: {reload_latency * 1e3:.0f} ms")
+    for label, orm_fn, snapshot_fn in (
+        ("page", orm_page, snapshot_page),
+        ("instructor + date filter", orm_filtered, snapshot_filtered),
+    ):
+        orm_latency = time_per_call(orm_fn, args.repeat)
+        snapshot_latency = time_per_call(snapshot_fn, args.repeat)
+        print(
+            f"{label}: ORM {orm_latency * 1e6:.0f} us, "
+            f"snapshot {snapshot_latency * 1e6:.0f} us "
+            f"({orm_latency / snapshot_latency:.0f}x)"
+        )
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Measure per-call Python overhead of the crud select helpers.
+
+Compares the previous legacy Query chain with the select() builder and the
+prebuilt primary key statement used by the get_*_by_id services.
+
+Run from the repository root:
+    python -m benchmarks.bench_select_records --calls 20000
+"""
+
+import argparse
+import time
+from datetime import date, time as dt_time
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Query, sessionmaker
+from sqlalchemy.pool import StaticPool
+from app.crud import select_records, select_record_by_id
+from app.database import Base
+from app.models import FitnessClass
+
+
+def legacy_select_by_id(db, fitness_class_id):
+    """The Query-based lookup used before the select() builder."""
+    query = Query(session=db, entities=FitnessClass)
+    query = query.filter(FitnessClass.id == fitness_class_id)
+    return query.first()
+
+
+def builder_select_by_id(db, fitness_class_id):
+    return select_records(
+        db, FitnessClass, filter_conditions=[FitnessClass.id == fitness_class_id]
+    ).first()
+
+
+def template_select_by_id(db, fitness_class_id):
+    return select_record_by_id(db, FitnessClass, fitness_class_id)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=20_000)
+    args = parser.parse_args()
+
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    db = Session()
+    fitness_class = FitnessClass(
+        name="Yoga",
+        instructor="Ann",
+        class_date=date.today(),
+        start_time=dt_time(9, 0),
+        available_slots=10,
+    )
+    db.add(fitness_class)
+    db.commit()
+    fitness_class_id = fitness_class.id
+
+    for label, lookup in (
+        ("legacy Query", legacy_select_by_id),
+        ("select() builder", builder_select_by_id),
+        ("prebuilt statement", template_select_by_id),
+    ):
+        lookup(db, fitness_class_id)  # warm the compiled cache
+        started = time.perf_counter()
+        for _ in range(args.calls):
+            lookup(db, fitness_class_id)
+        per_call = (time.perf_counter() - started) / args.calls
+        print(f"{label:20s} {per_call * 1e6:6.1f} us/call")
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Measure cold-start cost of the API: import time of `app.main` and the time
+from spawning a uvicorn worker until it answers its first request.
+
+Run from the repository root:
+    python -m benchmarks.bench_startup --runs 5
+"""
+
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_PROBE = (
+    "import sys, time\n"
+    "started = time.perf_counter()\n"
+    "import app.main\n"
+    "print(time.perf_counter() - started, 'pytz' in sys.modules)\n"
+)
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def measure_import(env, workdir):
+    output = subprocess.run(
+        [sys.executable, "-c", IMPORT_PROBE],
+        cwd=workdir,
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.split()
+    return float(output[0]), output[1] == "True"
+
+
+def measure_first_request(env, workdir, timeout=30.0):
+    port = free_port()
+    url = f"http://127.0.0.1:{port}/api/users/"
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port)],
+        cwd=workdir,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        while time.perf_counter() - started < timeout:
+            try:
+                with urllib.request.urlopen(url) as response:
+                    if response.status == 200:
+                        return time.perf_counter() - started
+            except (urllib.error.URLError, ConnectionError):
+                time.sleep(0.005)
+        raise RuntimeError("server did not answer in time")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument(
+        "--warm-pool", action="store_true", help="set FITSTUDIO_WARM_POOL=1"
+    )
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        path for path in (REPO_ROOT, env.get("PYTHONPATH")) if path
+    )
+    if args.warm_pool:
+        env["FITSTUDIO_WARM_POOL"] = "1"
+
+    with tempfile.TemporaryDirectory() as workdir:
+        subprocess.run(
+            [sys.executable, "-m", "app.manage", "init-db"],
+            cwd=workdir,
+            env=env,
+            check=True,
+            capture_output=True,
+        )
+
+        imports = [measure_import(env, workdir) for _ in range(args.runs)]
+        first_requests = [measure_first_request(env, workdir) for _ in range(args.runs)]
+
+    import_times = [seconds for seconds, _ in imports]
+    print(
+        f"import app.main:        {statistics.median(import_times) * 1e3:.0f} ms (median of {args.runs})"
+    )
+    print(f"pytz loaded at import:  {imports[0][1]}")
+    print(
+        f"time to first request:  {statistics.median(first_requests) * 1e3:.0f} ms (median of {args.runs})"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""
+Compare text uuid4 keys with 16-byte BLOB uuid7 keys on a large bookings table.
+
+Reports on-disk index size, insert rate and join speed for each layout.
+
+Run from the repository root:
+    python -m benchmarks.bench_uuid_keys --bookings 500000
+"""
+
+import argparse
+import os
+import sqlite3
+import tempfile
+import time
+import uuid
+from datetime import date
+from sqlalchemy import (
+    Column,
+    Date,
+    ForeignKey,
+    MetaData,
+    String,
+    Table,
+    UniqueConstraint,
+    create_engine,
+    insert,
+)
+from app.models import UUIDBlob, uuid7
+
+BATCH_SIZE = 10_000
+
+LAYOUTS = {
+    "text uuid4": (String, lambda: str(uuid.uuid4())),
+    "blob uuid7": (UUIDBlob, uuid7),
+}
+
+
+def build_tables(key_type):
+    metadata = MetaData()
+    users = Table(
+        "users",
+        metadata,
+        Column("id", key_type, primary_key=True),
+        Column("email", String, unique=True, nullable=False),
+    )
+    classes = Table(
+        "fitness_classes",
+        metadata,
+        Column("id", key_type, primary_key=True),
+        Column("name", String, nullable=False),
+    )
+    bookings = Table(
+        "bookings",
+        metadata,
+        Column("id", key_type, primary_key=True),
+        Column("user_id", key_type, ForeignKey("users.id"), nullable=False),
+        Column("class_id", key_type, ForeignKey("fitness_classes.id"), nullable=False),
+        Column("booked_at", Date, nullable=False),
+        UniqueConstraint("user_id", "class_id", name="uix_user_class_booking"),
+    )
+    return metadata, users, classes, bookings
+
+
+def index_bytes(db_path):
+    """Bytes used by every index, via the dbstat virtual table when available."""
+    connection = sqlite3.connect(db_path)
+    try:
+        rows = connection.execute(
+            "SELECT SUM(pgsize) FROM dbstat WHERE name IN "
+            "(SELECT name FROM sqlite_master WHERE type = 'index')"
+        ).fetchone()
+        return rows[0] or 0
+    except sqlite3.OperationalError:
+        return None
+    finally:
+        connection.close()
+
+
+def run_layout(label, key_type, new_id, args, workdir):
+    db_path = os.path.join(workdir, label.replace(" ", "_") + ".db")
+    engine = create_engine(f"sqlite:///{db_path}")
+    metadata, users, classes, bookings = build_tables(key_type)
+    metadata.create_all(bind=engine)
+
+    user_ids = [new_id() for _ in range(args.users)]
+    class_ids = [new_id() for _ in range(args.classes)]
+    with engine.begin() as conn:
+        conn.execute(
+            insert(users),
+            [
+                {"id": uid, "email": f"user{i}@example.com"}
+                for i, uid in enumerate(user_ids)
+            ],
+        )
+        conn.execute(
+            insert(classes), [{"id": cid, "name": "Yoga"} for cid in class_ids]
+        )
+
+    today = date.today()
+    started = time.perf_counter()
+    inserted = 0
+    while inserted < args.bookings:
+        batch = []
+        for i in range(inserted, min(inserted + BATCH_SIZE, args.bookings)):
+            batch.append(
+                {
+                    "id": new_id(),
+                    "user_id": user_ids[i % args.users],
+                    "class_id": class_ids[(i // args.users) % args.classes],
+                    "booked_at": today,
+                }
+            )
+        with engine.begin() as conn:
+            conn.execute(insert(bookings), batch)
+        inserted += len(batch)
+    insert_seconds = time.perf_counter() - started
+
+    join_sql = (
+        "SELECT COUNT(*) FROM bookings b "
+        "JOIN users u ON u.id = b.user_id "
+        "JOIN fitness_classes c ON c.id = b.class_id"
+    )
+    connection = sqlite3.connect(db_path)
+    started = time.perf_counter()
+    for _ in range(args.repeat):
+        connection.execute(join_sql).fetchone()
+    join_seconds = (time.perf_counter() - started) / args.repeat
+    connection.close()
+    engine.dispose()
+
+    indexes = index_bytes(db_path)
+    print(f"{label}:")
+    print(f"  database size:   {os.path.getsize(db_path) / 2**20:.1f} MiB")
+    if indexes is not None:
+        print(f"  index size:      {indexes / 2**20:.1f} MiB")
+    print(f"  insert rate:     {args.bookings / insert_seconds:,.0f} bookings/s")
+    print(f"  three-way join:  {join_seconds * 1e3:.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--classes", type=int, default=1_000)
+    parser.add_argument("--bookings", type=int, default=500_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    if args.bookings > args.users * args.classes:
+        parser.error("--bookings cannot exceed --users * --classes")
+
+    with tempfile.TemporaryDirectory() as workdir:
+        for label, (key_type, new_id) in LAYOUTS.items():
+            run_layout(label, key_type, new_id, args, workdir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Add the duration_minutes column to fitness_classes in an existing SQLite
+database. Existing classes get the default length of 60 minutes.
+
+Run from the repository root:
+    python -m migrations.add_class_duration [path/to/fitstudio.db]
+"""
+
+import argparse
+import sqlite3
+from app.database import DATABASE_URL
+
+
+def migrate(db_path):
+    connection = sqlite3.connect(db_path)
+    try:
+        columns = [
+            row[1] for row in connection.execute("PRAGMA table_info(fitness_classes)")
+        ]
+        if "duration_minutes" in columns:
+            print("fitness_classes.duration_minutes already exists")
+            return
+        with connection:
+            connection.execute(
+                "ALTER TABLE fitness_classes "
+                "ADD COLUMN duration_minutes INTEGER NOT NULL DEFAULT 60"
+            )
+        print("Added fitness_classes.duration_minutes")
+    finally:
+        connection.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Add class durations")
+    parser.add_argument(
+        "db_path",
+        nargs="?",
+        default=DATABASE_URL.replace("sqlite:///", "", 1),
+        help="SQLite database file to migrate",
+    )
+    args = parser.parse_args()
+    migrate(args.db_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Convert an existing SQLite database from 36-character text UUID keys to
+16-byte BLOB keys.
+
+The current schema is created in a new database file, every row is copied
+across with its id, user_id and class_id packed into raw bytes, and the
+files are swapped. The original database is kept next to it with a
+`.bak` suffix. Existing IDs keep their value, so public URLs do not change.
+The migration refuses to run on a database whose keys are already BLOBs, or
+when a `.bak` file from an earlier run is still in place.
+
+Run from the repository root while the API is stopped:
+    python -m migrations.compact_uuid_keys [path/to/fitstudio.db]
+"""
+
+import argparse
+import os
+import sqlite3
+import uuid
+from sqlalchemy import create_engine
+from app.database import DATABASE_URL
+from app.models import Base
+
+BATCH_SIZE = 10_000
+
+# Tables in foreign key order, with the columns holding UUIDs
+UUID_COLUMNS = {
+    "users": ("id",),
+    "fitness_classes": ("id",),
+    "bookings": ("id", "user_id", "class_id"),
+}
+
+
+def to_blob(value):
+    if value is None or isinstance(value, bytes):
+        return value
+    return uuid.UUID(value).bytes
+
+
+def keys_are_blobs(db_path):
+    """Whether the database was already created with (or migrated to) BLOB keys."""
+    connection = sqlite3.connect(db_path)
+    try:
+        for _, name, column_type, *_ in connection.execute("PRAGMA table_info(users)"):
+            if name == "id":
+                return column_type.upper() == "BLOB"
+        return False
+    finally:
+        connection.close()
+
+
+def copy_table(source, target, table, uuid_columns):
+    columns = [row[1] for row in source.execute(f"PRAGMA table_info({table})")]
+    uuid_positions = [columns.index(col) for col in uuid_columns]
+    column_list = ", ".join(columns)
+    placeholders = ", ".join("?" for _ in columns)
+    insert_sql = f"INSERT INTO {table} ({column_list}) VALUES ({placeholders})"
+
+    cursor = source.execute(f"SELECT {column_list} FROM {table}")
+    copied = 0
+    while True:
+        rows = cursor.fetchmany(BATCH_SIZE)
+        if not rows:
+            break
+        converted = []
+        for row in rows:
+            row = list(row)
+            for position in uuid_positions:
+                row[position] = to_blob(row[position])
+            converted.append(row)
+        target.executemany(insert_sql, converted)
+        copied += len(converted)
+    return copied
+
+
+def migrate(db_path):
+    new_path = f"{db_path}.new"
+    backup_path = f"{db_path}.bak"
+    if keys_are_blobs(db_path):
+        print(f"{db_path} already uses BLOB keys")
+        return
+    if os.path.exists(backup_path):
+        print(f"{backup_path} already exists; move it aside before migrating again")
+        return
+    if os.path.exists(new_path):
+        os.remove(new_path)
+
+    engine = create_engine(f"sqlite:///{new_path}")
+    Base.metadata.create_all(bind=engine)
+    engine.dispose()
+
+    source = sqlite3.connect(db_path)
+    target = sqlite3.connect(new_path)
+    try:
+        with target:
+            for table, uuid_columns in UUID_COLUMNS.items():
+                copied = copy_table(source, target, table, uuid_columns)
+                print(f"{table}: copied {copied} rows")
+    finally:
+        source.close()
+        target.close()
+
+    os.replace(db_path, backup_path)
+    os.replace(new_path, db_path)
+    print(f"Migrated {db_path}; original kept at {backup_path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert text UUID keys to BLOB keys")
+    parser.add_argument(
+        "db_path",
+        nargs="?",
+        default=DATABASE_URL.replace("sqlite:///", "", 1),
+        help="SQLite database file to migrate",
+    )
+    args = parser.parse_args()
+    migrate(args.db_path)
+
+
+if __name__ == "__main__":
+    main()
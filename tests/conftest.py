@@ -0,0 +1,83 @@
+import itertools
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from app import database
+from app.main import app
+from app.models import Base
+from app.services.schedule_snapshot import schedule_snapshot
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session_factory(engine):
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture
+def db(session_factory):
+    session = session_factory()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def client(session_factory):
+    def get_test_db():
+        session = session_factory()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    # The snapshot is process-wide; start every test from the test database
+    schedule_snapshot.invalidate()
+    app.dependency_overrides[database.get_db] = get_test_db
+    with TestClient(app) as test_client:
+        yield test_client
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def create_user(client):
+    emails = itertools.count()
+
+    def create(name="Asha", email=None):
+        email = email or f"{name.lower()}-{next(emails)}@example.com"
+        response = client.post("/api/users/", json={"name": name, "email": email})
+        assert response.status_code == 201, response.json()
+        return response.json()["user_id"]
+
+    return create
+
+
+@pytest.fixture
+def create_class(client):
+    def create(**overrides):
+        data = {
+            "name": "Yoga",
+            "description": "",
+            "class_date": "2030-01-01",
+            "start_time": "09:00",
+            "instructor": "Ravi",
+            "available_slots": 10,
+        }
+        data.update(overrides)
+        response = client.post("/api/fitness_classes/", json=data)
+        assert response.status_code == 201, response.json()
+        return response.json()["fitness_class_id"]
+
+    return create
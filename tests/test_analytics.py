@@ -0,0 +1,127 @@
+from datetime import date
+from sqlalchemy import select
+from app.models import (
+    DailyClassBookingRollup,
+    DailyInstructorBookingRollup,
+    DailyUserBookingRollup,
+)
+from app.services import analytics_service
+
+
+def book(client, user_id, class_id):
+    return client.post(
+        "/api/bookings/", json={"user_id": user_id, "class_id": class_id}
+    )
+
+
+def rollup_rows(db):
+    return {
+        model.__tablename__: sorted(
+            tuple(row) for row in db.execute(select(*model.__table__.columns))
+        )
+        for model in (
+            DailyClassBookingRollup,
+            DailyInstructorBookingRollup,
+            DailyUserBookingRollup,
+        )
+    }
+
+
+def test_bookings_update_rollups(client, create_class, create_user):
+    yoga = create_class(instructor="Ravi")
+    spin = create_class(instructor="Meera", start_time="18:00")
+    asha = create_user("Asha")
+    vikram = create_user("Vikram")
+    for user_id, class_id in ((asha, yoga), (vikram, yoga), (asha, spin)):
+        assert book(client, user_id, class_id).status_code == 201
+
+    assert client.get("/api/analytics/classes").json() == [
+        {"class_id": yoga, "bookings": 2},
+        {"class_id": spin, "bookings": 1},
+    ]
+    assert client.get("/api/analytics/instructors").json() == [
+        {"instructor": "Ravi", "bookings": 2},
+        {"instructor": "Meera", "bookings": 1},
+    ]
+    assert client.get("/api/analytics/days").json() == [
+        {"booking_date": date.today().isoformat(), "bookings": 3}
+    ]
+    history = client.get(f"/api/analytics/users/{asha}").json()
+    assert history["total_bookings"] == 2
+    assert history["days"] == [
+        {"booking_date": date.today().isoformat(), "bookings": 2}
+    ]
+
+
+def test_rejected_duplicate_booking_leaves_rollups_unchanged(
+    client, db, create_class, create_user
+):
+    class_id = create_class()
+    user_id = create_user()
+    assert book(client, user_id, class_id).status_code == 201
+    before = rollup_rows(db)
+
+    assert book(client, user_id, class_id).status_code == 400
+    assert rollup_rows(db) == before
+
+
+def test_ties_are_paged_in_a_stable_order(client, create_class, create_user):
+    user_id = create_user()
+    instructors = ["Meera", "Ravi", "Anil", "Zoya"]
+    for instructor in instructors:
+        assert (
+            book(client, user_id, create_class(instructor=instructor)).status_code
+            == 201
+        )
+
+    pages = [
+        client.get(
+            "/api/analytics/instructors", params={"page": page, "limit": 1}
+        ).json()[0]["instructor"]
+        for page in range(1, 5)
+    ]
+    assert pages == sorted(instructors)
+
+
+def test_rebuild_matches_incremental_rollups(client, db, create_class, create_user):
+    yoga = create_class(instructor="Ravi")
+    spin = create_class(instructor="Meera", start_time="18:00")
+    for name in ("Asha", "Vikram", "Neha"):
+        user_id = create_user(name)
+        assert book(client, user_id, yoga).status_code == 201
+        if name != "Neha":
+            assert book(client, user_id, spin).status_code == 201
+    incremental = rollup_rows(db)
+
+    analytics_service.rebuild_rollups(db)
+    assert rollup_rows(db) == incremental
+
+
+def test_deleted_class_leaves_rollups_and_rebuild_agrees(
+    client, db, create_class, create_user
+):
+    yoga = create_class(instructor="Ravi")
+    spin = create_class(instructor="Ravi", start_time="18:00")
+    asha = create_user("Asha")
+    vikram = create_user("Vikram")
+    for user_id, class_id in ((asha, yoga), (vikram, yoga), (asha, spin)):
+        assert book(client, user_id, class_id).status_code == 201
+
+    assert client.delete(f"/api/fitness_classes/{yoga.upper()}").status_code == 200
+
+    today = date.today().isoformat()
+    assert client.get("/api/analytics/classes").json() == [
+        {"class_id": spin, "bookings": 1}
+    ]
+    assert client.get("/api/analytics/instructors").json() == [
+        {"instructor": "Ravi", "bookings": 1}
+    ]
+    assert client.get("/api/analytics/days").json() == [
+        {"booking_date": today, "bookings": 1}
+    ]
+    assert client.get(f"/api/analytics/users/{asha}").json()["total_bookings"] == 1
+    assert client.get(f"/api/analytics/users/{vikram}").json()["days"] == []
+    incremental = rollup_rows(db)
+
+    analytics_service.rebuild_rollups(db)
+    assert rollup_rows(db) == incremental
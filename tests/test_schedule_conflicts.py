@@ -0,0 +1,201 @@
+from datetime import date, time
+from sqlalchemy import insert
+from app.models import FitnessClass, uuid7
+from app.services.schedule_conflicts import (
+    InstructorIntervalIndex,
+    ScheduledClass,
+    class_interval,
+    search_windows,
+)
+
+
+def class_data(**overrides):
+    data = {
+        "name": "Yoga",
+        "description": "",
+        "class_date": "2030-01-01",
+        "start_time": "09:00",
+        "duration_minutes": 60,
+        "instructor": "Ravi",
+        "available_slots": 10,
+    }
+    data.update(overrides)
+    return data
+
+
+def post_class(client, **overrides):
+    return client.post("/api/fitness_classes/", json=class_data(**overrides))
+
+
+def test_overlapping_class_is_rejected(client, create_class):
+    existing = create_class(start_time="09:00", duration_minutes=60)
+
+    response = post_class(client, start_time="09:30")
+    assert response.status_code == 400
+    assert existing in response.json()["detail"]
+
+
+def test_back_to_back_and_other_instructor_are_allowed(client, create_class):
+    create_class(start_time="09:00", duration_minutes=60)
+
+    assert post_class(client, start_time="10:00").status_code == 201
+    assert post_class(client, start_time="08:00").status_code == 201
+    assert post_class(client, start_time="09:30", instructor="Meera").status_code == (
+        201
+    )
+
+
+def test_class_crossing_midnight_conflicts_with_next_day(client, create_class):
+    create_class(class_date="2030-12-31", start_time="23:30", duration_minutes=480)
+
+    assert (
+        post_class(client, class_date="2031-01-01", start_time="02:00").status_code
+        == 400
+    )
+    assert (
+        post_class(client, class_date="2031-01-01", start_time="07:30").status_code
+        == 201
+    )
+
+
+def test_update_does_not_conflict_with_itself(client, create_class):
+    fitness_class_id = create_class(start_time="09:00", duration_minutes=60)
+
+    response = client.put(
+        f"/api/fitness_classes/{fitness_class_id}",
+        json={"start_time": "09:30"},
+    )
+    assert response.status_code == 200, response.json()
+
+    response = client.put(
+        f"/api/fitness_classes/{fitness_class_id.upper()}",
+        json={"duration_minutes": 90},
+    )
+    assert response.status_code == 200, response.json()
+
+
+def test_update_into_another_class_is_rejected(client, create_class):
+    create_class(start_time="09:00")
+    later = create_class(start_time="11:00")
+
+    response = client.put(f"/api/fitness_classes/{later}", json={"start_time": "09:30"})
+    assert response.status_code == 400
+    fitness_class = client.get(f"/api/fitness_classes/{later}").json()
+    assert fitness_class["start_time"].startswith("11:00")
+
+
+def test_update_onto_an_identical_start_time_reports_the_schedule(client, create_class):
+    create_class(start_time="09:00")
+    later = create_class(start_time="11:00")
+
+    response = client.put(f"/api/fitness_classes/{later}", json={"start_time": "09:00"})
+    assert response.status_code == 400
+    assert "already scheduled" in response.json()["detail"]
+
+
+def test_update_rejects_null_for_required_fields(client, create_class):
+    fitness_class_id = create_class()
+
+    for field in ("start_time", "class_date", "duration_minutes"):
+        response = client.put(
+            f"/api/fitness_classes/{fitness_class_id}", json={field: None}
+        )
+        assert response.status_code == 422, field
+
+
+def test_bulk_rejects_overlaps_within_the_request(client):
+    response = client.post(
+        "/api/fitness_classes/bulk",
+        json=[
+            class_data(start_time="09:00"),
+            class_data(start_time="11:00"),
+            class_data(start_time="11:30"),
+        ],
+    )
+    assert response.status_code == 400
+    assert "1 and 2" in response.json()["detail"]
+    assert client.get("/api/fitness_classes/").json() == []
+
+
+def test_bulk_checks_against_existing_classes(client, create_class):
+    create_class(start_time="09:00")
+
+    response = client.post(
+        "/api/fitness_classes/bulk",
+        json=[class_data(start_time="07:00"), class_data(start_time="09:15")],
+    )
+    assert response.status_code == 400
+
+    response = client.post(
+        "/api/fitness_classes/bulk",
+        json=[class_data(start_time="07:00"), class_data(start_time="10:00")],
+    )
+    assert response.status_code == 201, response.json()
+    assert len(response.json()["fitness_class_ids"]) == 2
+    assert len(client.get("/api/fitness_classes/").json()) == 3
+
+
+def test_delete_frees_the_slot(client, create_class):
+    fitness_class_id = create_class(start_time="09:00")
+
+    response = client.delete(f"/api/fitness_classes/{fitness_class_id.upper()}")
+    assert response.status_code == 200, response.json()
+    assert post_class(client, start_time="09:30").status_code == 201
+
+
+def test_class_written_by_another_process_is_detected(client, db):
+    # No in-process state knows about this class; the check must read the database
+    db.execute(
+        insert(FitnessClass),
+        [
+            {
+                "id": uuid7(),
+                "name": "Spin",
+                "instructor": "Ravi",
+                "class_date": date(2030, 1, 1),
+                "start_time": time(9, 0),
+                "duration_minutes": 60,
+                "available_slots": 5,
+            }
+        ],
+    )
+    db.commit()
+
+    assert post_class(client, start_time="09:45").status_code == 400
+
+
+def test_interval_index_overlapping():
+    index = InstructorIntervalIndex()
+    index.add("long", *class_interval(date(2030, 1, 1), time(6, 0), 240))
+    index.add("short", *class_interval(date(2030, 1, 1), time(11, 0), 30))
+
+    def overlapping(start_time, duration, exclude_id=None):
+        start, end = class_interval(date(2030, 1, 1), start_time, duration)
+        return index.overlapping(start, end, exclude_id=exclude_id)
+
+    assert overlapping(time(9, 30), 60) == ["long"]
+    assert overlapping(time(10, 0), 60) == []
+    assert overlapping(time(10, 30), 60) == ["short"]
+    assert overlapping(time(11, 30), 30) == []
+    assert overlapping(time(9, 0), 150) == ["long", "short"]
+    assert overlapping(time(9, 0), 150, exclude_id="long") == ["short"]
+
+
+def test_search_windows_are_merged_per_instructor():
+    def scheduled(instructor, start_time, class_date=date(2030, 1, 1)):
+        return ScheduledClass(None, instructor, class_date, start_time, 60)
+
+    windows = search_windows(
+        [
+            scheduled("Ravi", time(9, 0)),
+            scheduled("Ravi", time(10, 0)),
+            scheduled("Ravi", time(9, 0), class_date=date(2030, 2, 1)),
+            scheduled("Meera", time(9, 0)),
+        ]
+    )
+
+    day = date(2030, 1, 1).toordinal() * 1440
+    assert windows["Meera"] == [(day + 60, day + 600)]
+    # Overlapping windows share one query; a far-off date gets its own
+    assert len(windows["Ravi"]) == 2
+    assert windows["Ravi"][0] == (day + 60, day + 660)
@@ -0,0 +1,153 @@
+import threading
+from datetime import date, time
+from sqlalchemy import insert
+from app.models import FitnessClass, uuid7
+from app.services import schedule_snapshot as schedule_snapshot_module
+from app.services.schedule_snapshot import ScheduleRow, ScheduleSnapshot
+
+
+def insert_class_directly(db):
+    """Write a class without going through the API, as another worker would."""
+    db.execute(
+        insert(FitnessClass),
+        [
+            {
+                "id": uuid7(),
+                "name": "Spin",
+                "instructor": "Ravi",
+                "class_date": date(2030, 1, 1),
+                "start_time": time(9, 0),
+                "available_slots": 5,
+            }
+        ],
+    )
+    db.commit()
+
+
+def listing(client, **params):
+    response = client.get("/api/fitness_classes/", params=params)
+    assert response.status_code == 200, response.json()
+    return response.json()
+
+
+def test_listing_is_sorted_and_paged(client, create_class):
+    late = create_class(class_date="2030-01-02", start_time="09:00")
+    early = create_class(class_date="2030-01-01", start_time="08:00")
+    middle = create_class(class_date="2030-01-01", start_time="10:00")
+
+    assert [fc["id"] for fc in listing(client)] == [early, middle, late]
+    assert [fc["id"] for fc in listing(client, page=2, limit=2)] == [late]
+    assert listing(client, page=3, limit=2) == []
+
+
+def test_non_positive_page_does_not_reach_before_the_date_filter(client, create_class):
+    create_class(class_date="2030-01-01")
+    later = create_class(class_date="2030-01-02")
+
+    for page in (0, -3):
+        classes = listing(client, page=page, limit=2, date_from="2030-01-02")
+        assert [fc["id"] for fc in classes] == [later]
+
+
+def test_listing_filters_by_instructor_and_date(client, create_class):
+    create_class(instructor="Ravi", class_date="2030-01-01")
+    meera_first = create_class(instructor="Meera", class_date="2030-01-02")
+    meera_second = create_class(instructor="Meera", class_date="2030-01-03")
+    create_class(instructor="Ravi", class_date="2030-01-03", start_time="12:00")
+
+    meera = listing(client, instructor="Meera")
+    assert [fc["id"] for fc in meera] == [meera_first, meera_second]
+    assert [
+        fc["id"] for fc in listing(client, instructor="Meera", page=2, limit=1)
+    ] == [meera_second]
+
+    in_range = listing(client, date_from="2030-01-02", date_to="2030-01-02")
+    assert [fc["id"] for fc in in_range] == [meera_first]
+    assert listing(client, instructor="Meera", date_from="2030-01-03")[0]["id"] == (
+        meera_second
+    )
+    assert listing(client, instructor="Nobody") == []
+
+
+def test_snapshot_follows_updates_and_deletes(client, create_class):
+    first = create_class(start_time="09:00")
+    second = create_class(start_time="11:00")
+    assert [fc["id"] for fc in listing(client)] == [first, second]
+
+    response = client.put(
+        f"/api/fitness_classes/{second}",
+        json={"start_time": "07:00", "instructor": "Meera"},
+    )
+    assert response.status_code == 200
+    assert [fc["id"] for fc in listing(client)] == [second, first]
+    assert [fc["id"] for fc in listing(client, instructor="Meera")] == [second]
+    assert listing(client, instructor="Ravi")[0]["id"] == first
+
+    response = client.delete(f"/api/fitness_classes/{first.upper()}")
+    assert response.status_code == 200
+    assert [fc["id"] for fc in listing(client)] == [second]
+    assert listing(client, instructor="Ravi") == []
+
+
+def test_booking_updates_listed_slots(client, create_class, create_user):
+    class_id = create_class(available_slots=1)
+    user_id = create_user()
+
+    response = client.post(
+        "/api/bookings/", json={"user_id": user_id, "class_id": class_id.upper()}
+    )
+    assert response.status_code == 201, response.json()
+    assert listing(client)[0]["available_slots"] == 0
+    assert client.get(f"/api/fitness_classes/{class_id}").json()["available_slots"] == 0
+
+
+def test_stale_snapshot_reloads_out_of_band_writes(db):
+    snapshot = ScheduleSnapshot(max_age=0)
+    snapshot.ensure_loaded(db)
+    assert snapshot.list_classes() == []
+
+    insert_class_directly(db)
+
+    snapshot.ensure_loaded(db)
+    assert [row.name for row in snapshot.list_classes()] == ["Spin"]
+
+
+def test_fresh_snapshot_is_not_reloaded(db):
+    snapshot = ScheduleSnapshot(max_age=3600)
+    snapshot.ensure_loaded(db)
+    insert_class_directly(db)
+
+    snapshot.ensure_loaded(db)
+    assert snapshot.list_classes() == []
+
+
+def test_reload_serves_readers_and_keeps_concurrent_writes(db, monkeypatch):
+    snapshot = ScheduleSnapshot(max_age=0)
+    snapshot.ensure_loaded(db)
+    insert_class_directly(db)
+    written = ScheduleRow(
+        uuid7(), "Barre", "", "Meera", date(2030, 1, 2), time(8, 0), 60, 3
+    )
+    seen_during_reload = []
+
+    def select_while_others_run(*args, **kwargs):
+        # Another request lists and writes while the table is being read
+        def other_request():
+            seen_during_reload.append(snapshot.list_classes())
+            snapshot.upsert(written)
+
+        thread = threading.Thread(target=other_request)
+        thread.start()
+        thread.join(timeout=5)
+        assert not thread.is_alive(), "reload blocked other requests"
+        return select_records(*args, **kwargs)
+
+    select_records = schedule_snapshot_module.select_records
+    monkeypatch.setattr(
+        schedule_snapshot_module, "select_records", select_while_others_run
+    )
+    snapshot.ensure_loaded(db)
+
+    assert seen_during_reload == [[]]
+    assert [row.name for row in snapshot.list_classes()] == ["Spin", "Barre"]
+    assert [row.name for row in snapshot.list_classes(instructor="Meera")] == ["Barre"]
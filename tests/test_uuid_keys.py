@@ -0,0 +1,140 @@
+import sqlite3
+import uuid
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import StatementError
+from app.crud import select_record_by_id
+from app.models import User, uuid7
+from migrations.compact_uuid_keys import migrate
+
+
+def test_uuid7_is_version_7_and_time_ordered():
+    ids = [uuid7() for _ in range(100)]
+    parsed = [uuid.UUID(value) for value in ids]
+    assert all(value.version == 7 for value in parsed)
+    assert all(value.variant == uuid.RFC_4122 for value in parsed)
+    timestamps = [value.int >> 80 for value in parsed]
+    assert timestamps == sorted(timestamps)
+
+
+def test_ids_are_stored_as_16_bytes_and_read_back_as_strings(db, create_user):
+    user_id = create_user()
+
+    stored = db.execute(text("SELECT typeof(id), length(id) FROM users")).one()
+    assert tuple(stored) == ("blob", 16)
+
+    user = select_record_by_id(db, User, user_id)
+    assert user.id == user_id
+    assert select_record_by_id(db, User, user_id.upper()) is user
+    assert select_record_by_id(db, User, uuid.UUID(user_id)) is user
+
+
+def test_malformed_ids_are_rejected_by_the_api(client, create_class):
+    class_id = create_class()
+
+    assert client.get("/api/users/nope").status_code == 422
+    assert client.get("/api/fitness_classes/nope").status_code == 422
+    response = client.post(
+        "/api/bookings/", json={"user_id": "nope", "class_id": class_id}
+    )
+    assert response.status_code == 422
+
+
+def test_malformed_ids_are_not_bound_silently(db):
+    with pytest.raises(StatementError):
+        select_record_by_id(db, User, "nope")
+
+
+BASELINE_SCHEMA = """
+CREATE TABLE users (
+    id VARCHAR NOT NULL PRIMARY KEY,
+    name VARCHAR NOT NULL,
+    email VARCHAR NOT NULL UNIQUE
+);
+CREATE TABLE fitness_classes (
+    id VARCHAR NOT NULL PRIMARY KEY,
+    name VARCHAR NOT NULL,
+    instructor VARCHAR NOT NULL,
+    class_date DATE NOT NULL,
+    start_time TIME NOT NULL,
+    available_slots INTEGER NOT NULL,
+    description VARCHAR,
+    CONSTRAINT uix_instructor_schedule UNIQUE (instructor, class_date, start_time)
+);
+CREATE TABLE bookings (
+    id VARCHAR NOT NULL PRIMARY KEY,
+    user_id VARCHAR NOT NULL REFERENCES users (id),
+    class_id VARCHAR NOT NULL REFERENCES fitness_classes (id),
+    booked_at DATE NOT NULL,
+    CONSTRAINT uix_user_class_booking UNIQUE (user_id, class_id)
+);
+"""
+
+
+def test_migration_converts_text_keys(tmp_path):
+    db_path = str(tmp_path / "fitstudio.db")
+    user_id, class_id, booking_id = (str(uuid.uuid4()) for _ in range(3))
+    connection = sqlite3.connect(db_path)
+    connection.executescript(BASELINE_SCHEMA)
+    connection.execute(
+        "INSERT INTO users VALUES (?, 'Asha', 'asha@example.com')", (user_id,)
+    )
+    connection.execute(
+        "INSERT INTO fitness_classes VALUES "
+        "(?, 'Yoga', 'Ravi', '2030-01-01', '09:00:00.000000', 10, '')",
+        (class_id,),
+    )
+    connection.execute(
+        "INSERT INTO bookings VALUES (?, ?, ?, '2030-01-01')",
+        (booking_id, user_id, class_id),
+    )
+    connection.commit()
+    connection.close()
+
+    migrate(db_path)
+
+    connection = sqlite3.connect(db_path)
+    booking = connection.execute(
+        "SELECT id, user_id, class_id FROM bookings"
+    ).fetchone()
+    duration = connection.execute(
+        "SELECT duration_minutes FROM fitness_classes"
+    ).fetchone()
+    connection.close()
+    assert booking == (
+        uuid.UUID(booking_id).bytes,
+        uuid.UUID(user_id).bytes,
+        uuid.UUID(class_id).bytes,
+    )
+    assert duration == (60,)
+    assert (tmp_path / "fitstudio.db.bak").exists()
+
+
+def test_migration_does_not_run_twice(tmp_path, capsys):
+    db_path = str(tmp_path / "fitstudio.db")
+    connection = sqlite3.connect(db_path)
+    connection.executescript(BASELINE_SCHEMA)
+    connection.close()
+    migrate(db_path)
+    original_backup = (tmp_path / "fitstudio.db.bak").read_bytes()
+
+    migrate(db_path)
+    assert "already uses BLOB keys" in capsys.readouterr().out
+    assert (tmp_path / "fitstudio.db.bak").read_bytes() == original_backup
+    assert not (tmp_path / "fitstudio.db.new").exists()
+
+
+def test_migration_keeps_an_existing_backup(tmp_path, capsys):
+    db_path = str(tmp_path / "fitstudio.db")
+    connection = sqlite3.connect(db_path)
+    connection.executescript(BASELINE_SCHEMA)
+    connection.close()
+    (tmp_path / "fitstudio.db.bak").write_bytes(b"earlier backup")
+
+    migrate(db_path)
+    assert "move it aside" in capsys.readouterr().out
+    assert (tmp_path / "fitstudio.db.bak").read_bytes() == b"earlier backup"
+    connection = sqlite3.connect(db_path)
+    id_type = connection.execute("PRAGMA table_info(users)").fetchone()[2]
+    connection.close()
+    assert id_type == "VARCHAR"